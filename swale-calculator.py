@@ -2,381 +2,898 @@
 from __future__ import annotations
 
 import argparse
-from copy import copy
+import importlib
+import json
+import math
+import os
+import platform
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Union
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable, Mapping, Sequence, TypedDict, Union
 
-from openpyxl import Workbook
-from openpyxl.cell.rich_text import CellRichText, TextBlock
-from openpyxl.cell.text import InlineFont
-from openpyxl.formatting.rule import FormulaRule
-from openpyxl.styles import Alignment, Border, Color, Font, PatternFill, Side
-from openpyxl.worksheet.page import PageMargins
-from openpyxl.worksheet.datavalidation import DataValidation
+if TYPE_CHECKING:
+    from openpyxl.styles import Alignment, Border, Font, PatternFill
 
+# Under PyPy, lxml's xmlfile builds the whole tree in memory instead of streaming;
+# openpyxl's stdlib writer is the faster path there. Must be set before importing openpyxl.
+if platform.python_implementation() == "PyPy":
+    os.environ.setdefault("OPENPYXL_LXML", "False")
 
-def make(out: Union[str, Path] = "swale_calculator.xlsx") -> Path:
-    wb = Workbook()
-    wb.calculation.fullCalcOnLoad = True  # force Excel recalculation on open
+# openpyxl is imported lazily (inside make() / _styles()) so `--help` and other
+# argparse-only invocations do not pay its import cost.
 
-    normal_style = wb._named_styles[0]
-    normal_font = copy(normal_style.font)
-    normal_font.name = "Roboto"
-    normal_font.size = 10
-    normal_style.font = normal_font
 
-    ws = wb.active
-    ws.title = "Swale Calculator"
-    ws.sheet_view.showGridLines = False
-    ws.page_margins = PageMargins(left=0.25, right=0.25, top=0.25, bottom=0.25, header=0.25, footer=0.25)
+@lru_cache(maxsize=None)
+def _xl_package() -> str:
+    # fastpyxl is an openpyxl fork with the same module layout and API; use it when
+    # installed, otherwise openpyxl. Picked once so every import comes from one package.
+    try:
+        import fastpyxl  # noqa: F401
+    except ImportError:
+        return "openpyxl"
+    return "fastpyxl"
 
-    # -----------------------------
-    # Styles (simple, inline)
-    # -----------------------------
-    title_font = Font(bold=True, size=14)
-    header_font = Font(bold=True, size=11)
-    bold_font = Font(bold=True)
-
-    center = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    left = Alignment(horizontal="left", vertical="center", wrap_text=True)
-    right = Alignment(horizontal="right", vertical="center", wrap_text=True)
-
-    # Use opaque ARGB fills (FF......) so Excel shows them
-    fill_header = PatternFill("solid", fgColor=Color(theme=9, tint=0.8))
-    fill_input = PatternFill(fill_type="solid", start_color="FFFFFF00", end_color="FFFFFF00")
-    fill_deprecated = PatternFill(fill_type="solid", start_color="FFF2F2F2", end_color="FFF2F2F2")
-    deprecate_font = Font(color="FF7F7F7F", strike=True)
-    thin = Side(style="thin", color="CCCCCC")
-    border = Border(left=thin, right=thin, top=thin, bottom=thin)
 
-    def set_col_width(widths: dict[str, float]) -> None:
-        for col, width in widths.items():
-            ws.column_dimensions[col].width = width
+def _xl(module: str):
+    return importlib.import_module(f"{_xl_package()}.{module}")
 
-    def apply_border(cell_range: str) -> None:
-        for row in ws[cell_range]:
-            for cell in row:
-                cell.border = border
+# -----------------------------
+# Styles
+# -----------------------------
+HEADER_STYLE_NAME = "Table Header"
+GENERAL_FORMAT = "General"  # openpyxl's default number format; never written explicitly
 
-    def apply_left_border(cell_range: str) -> None:
-        left_border = Border(left=thin)
-        for row in ws[cell_range]:
-            for cell in row:
-                cell.border = left_border
 
-    # -----------------------------
-    # Layout
-    # -----------------------------
-    set_col_width(
-        {
-            "A": 21,
-            "B": 10,
-            "C": 10,
-            "D": 10,
-            "E": 10,
-            "F": 10,
-            "G": 10,
-            "H": 11,
-            "I": 10,
-            "J": 10,
+@lru_cache(maxsize=None)
+def _styles() -> SimpleNamespace:
+    # Built once per process on first use, so every cell (and every workbook make()
+    # builds) reuses the same style objects.
+    styles = _xl("styles")
+    Alignment, Border, Color, Font, PatternFill, Side = (
+        styles.Alignment, styles.Border, styles.Color, styles.Font, styles.PatternFill, styles.Side
+    )
+
+    thin = Side(style="thin", color="CCCCCC")
+    return SimpleNamespace(
+        # Normal style font: same family/color/scheme as openpyxl's default Calibri.
+        # Shared by every workbook; openpyxl registers fonts by value on save.
+        normal_font=Font(name="Roboto", size=10, family=2, color=Color(theme=1), scheme="minor"),
+        title_font=Font(bold=True, size=14),
+        header_font=Font(bold=True, size=11),
+        bold_font=Font(bold=True),
+        center=Alignment(horizontal="center", vertical="center", wrap_text=True),
+        left=Alignment(horizontal="left", vertical="center", wrap_text=True),
+        right=Alignment(horizontal="right", vertical="center", wrap_text=True),
+        align_title=Alignment(horizontal="left", vertical="top", wrap_text=True),
+        # Use opaque ARGB fills (FF......) so Excel shows them
+        fill_header=PatternFill("solid", fgColor=Color(theme=9, tint=0.8)),
+        fill_input=PatternFill(fill_type="solid", start_color="FFFFFF00", end_color="FFFFFF00"),
+        fill_deprecated=PatternFill(fill_type="solid", start_color="FFF2F2F2", end_color="FFF2F2F2"),
+        deprecate_font=Font(color="FF7F7F7F", strike=True),
+        border=Border(left=thin, right=thin, top=thin, bottom=thin),
+        left_border=Border(left=thin),
+    )
+
+
+# The same styles as XlsxWriter format properties, for make_xlsxwriter(). XlsxWriter
+# has no theme colors, so the header fill is theme 9 at tint 0.8 resolved to RGB.
+# Its cells keep XlsxWriter's default Calibri 11: make()'s cells use openpyxl's
+# default font (Calibri 11) too, as only the Normal named style carries Roboto 10.
+XLSXWRITER_STYLES: dict[str, dict[str, object]] = dict(
+    title_font=dict(bold=True, font_size=14),
+    header_font=dict(bold=True, font_size=11),
+    bold_font=dict(bold=True),
+    center=dict(align="center", valign="vcenter", text_wrap=True),
+    left=dict(align="left", valign="vcenter", text_wrap=True),
+    right=dict(align="right", valign="vcenter", text_wrap=True),
+    align_title=dict(align="left", valign="top", text_wrap=True),
+    fill_header=dict(pattern=1, bg_color="#FDE9D9"),
+    fill_input=dict(pattern=1, bg_color="#FFFF00"),
+    fill_deprecated=dict(pattern=1, bg_color="#F2F2F2"),
+    deprecate_font=dict(font_color="#7F7F7F", font_strikeout=True),
+    border=dict(border=1, border_color="#CCCCCC"),
+    left_border=dict(left=1, left_color="#CCCCCC"),
+)
+
+
+# -----------------------------
+# Table schemas: (column, header, alignment, number_format); alignment names a _styles() entry
+# -----------------------------
+# Sheet columns, 1-based as openpyxl numbers them; rows are built by list position.
+COL_A, COL_B, COL_C, COL_D, COL_E, COL_F, COL_G, COL_H, COL_I, COL_J = range(1, 11)
+
+COLUMN_WIDTHS = (
+    ("A", 21),
+    ("B", 10),
+    ("C", 10),
+    ("D", 10),
+    ("E", 10),
+    ("F", 10),
+    ("G", 10),
+    ("H", 11),
+    ("I", 10),
+    ("J", 10),
+)
+
+SITE_COLUMNS = [
+    (COL_A, "Description", "left", None),
+    (COL_B, "Sq. Feet", "right", "#,##0"),
+    (COL_C, "Acres", "right", "0.000"),
+    (COL_D, "Percent", "right", "0.0%"),
+]
+
+SWALE_COLUMNS = [
+    (COL_A, "Swale", "left", None),
+    (COL_B, "Type", "center", None),
+    (COL_C, "Bot W (ft)", "right", "0.0"),
+    (COL_D, "Bot L (ft)", "right", "0.0"),
+    (COL_E, "Width (ft)", "right", None),
+    (COL_F, "Length (ft)", "right", None),
+    (COL_G, "Depth (in)", "right", "0.0"),
+    (COL_H, "Volume (cf)", "right", "#,##0.0"),
+    # I: spacer column
+    (COL_J, "Select", "center", None),
+]
+
+
+# -----------------------------
+# Seed values (edit as needed)
+# -----------------------------
+# Site rows 3..7 in sheet order: label -> Sq. Feet.
+SITE_DEFAULTS = {
+    "Lot size": 6741,
+    "Building (incl. patios)": 3224,
+    "Driveway": 640,
+    "Equipment pads": 9,
+    "Other impervious": None,  # left blank (not "") so no empty string is written
+}
+
+# Swale rows 20..23.
+SWALE_DEFAULTS = [
+    # T-Swale/Frustum: top WxL in E/F, depth in G (in), bottom C/D auto-calculated at 3H:1V (using H1)
+    dict(name="Swale A", type="T-Swale", tw=8, tl=48),
+    dict(name="Swale B", type="T-Swale", tw=8, tl=24),
+    # V-Swale: E=top width, F=length, G=max depth (in) auto-calculated at 3H:1V (using H1)
+    dict(name="Swale C", type="V-Swale", tw=8, tl=48),
+    dict(name="Swale D", type="V-Swale", tw=8, tl=24),
+]
+
+SIDE_SLOPE = 3  # B17: side slope ratio (H:V)
+
+SWALE_KEYS = ("name", "type", "tw", "tl")
+# The sheet compares types with UPPER(), so "t-swale" is a T-Swale there too.
+SWALE_TYPES = ("T-SWALE", "V-SWALE")
+
+
+# -----------------------------
+# Site row formulas ({r} is the sheet row)
+# -----------------------------
+SITE_ACRES_TMPL = '=IF(OR(B{r}="",B{r}=0),"",B{r}/43560)'
+SITE_PERCENT_TMPL = '=IF(OR(B{r}="",B{r}=0,$B$3="",$B$3=0),"",B{r}/$B$3)'
+
+
+# -----------------------------
+# Retention options chart, rows 14..17: (F label, inches of rain, area cell)
+# -----------------------------
+RETENTION_OPTIONS = [
+    ('1/2" over lot', "0.5", "$B$3"),
+    ('1" over lot', "1", "$B$3"),
+    ('1.5" over lot', "1.5", "$B$3"),
+    ('1" over impervious', "1", "$B$9"),
+]
+RETENTION_VOLUMES = [f"({inches}/12)*{area}" for _label, inches, area in RETENTION_OPTIONS]
+
+# The option labels as an inline array constant ({"1/2"" over lot",...}), so Required
+# does not depend on the editable chart cells F14:F17.
+RETENTION_LABELS_ARRAY = "{" + ",".join(
+    '"' + label.replace('"', '""') + '"' for label, _inches, _area in RETENTION_OPTIONS
+) + "}"
+
+# Required picks the chart volume whose label matches the basis (B16) by position;
+# anything else, including the default "Max (...)" option, takes the larger of the two.
+# MATCH(TRUE,B16=labels,0) compares with "=" like the sheet's other checks:
+# case-insensitive, and "*"/"?" typed into B16 are not treated as wildcards.
+REQUIRED_FORMULA = "=IFERROR(CHOOSE(MATCH(TRUE,$B$16={},0),{}),MAX({},{}))".format(
+    RETENTION_LABELS_ARRAY,
+    ",".join(RETENTION_VOLUMES),
+    RETENTION_VOLUMES[0],
+    RETENTION_VOLUMES[-1],
+)
+# Provided = sum volumes where Select=YES (H20:H23, J20:J23)
+PROVIDED_FORMULA = '=SUMPRODUCT(--($J$20:$J$23="YES"),$H$20:$H$23)'
+
+
+# -----------------------------
+# Swale row formulas ({r} is the sheet row)
+# -----------------------------
+T_SWALE_DEPTH_TMPL = '=IF(OR(E{r}="",F{r}=""),"",12*MAX(0,MIN((E{r}-2)/(2*$B$17),(F{r}-2)/(2*$B$17))))'
+T_SWALE_BOT_W_TMPL = '=IF(OR(E{r}="",G{r}=""),"",MAX(0,E{r}-2*$B$17*(G{r}/12)))'
+T_SWALE_BOT_L_TMPL = '=IF(OR(F{r}="",G{r}=""),"",MAX(0,F{r}-2*$B$17*(G{r}/12)))'
+V_SWALE_DEPTH_TMPL = '=IF(E{r}="","",12*(E{r}/(2*$B$17)))'
+
+# Volume formula:
+# - V-Swale (with sloped short sides): prismoid along length,
+#   h*TopWidth*(2*TopLength + BottomLength)/6, where BottomLength=max(0, TopLength-TopWidth)
+# - T-Swale/Frustum: h/3*(A1+A2+sqrt(A1*A2)), A1=C*D, A2=E*F, h=G/12
+SWALE_VOLUME_TMPL = (
+    '=IF(UPPER($B{r})="V-SWALE",'
+    'IF(OR(E{r}="",F{r}="",G{r}=""),"",(G{r}/12)*E{r}*(2*F{r}+MAX(0,F{r}-E{r}))/6),'
+    'IF(OR(C{r}="",D{r}="",E{r}="",F{r}="",G{r}=""),"",'
+    '(G{r}/12)/3*((C{r}*D{r})+(E{r}*F{r})+SQRT((C{r}*D{r})*(E{r}*F{r}))))'
+    ')'
+)
+
+
+# -----------------------------
+# Data validations
+# -----------------------------
+TRAP_MIN_BOTTOM_MESSAGES = dict(
+    promptTitle="T-Swale Minimum Bottom",
+    prompt="For T-Swales, top width and top length must each be at least 2.0 ft so bottom sides stay >= 2.0 ft.",
+    errorTitle="Invalid T-Swale Top Dimensions",
+    error="Increase top width/length to at least 2.0 ft to keep T-Swale bottom width/length at or above 2.0 ft.",
+)
+BOTTOM_LOCKED_MESSAGES = dict(
+    promptTitle="Calculated Cell",
+    prompt="Bottom Width/Length are calculated automatically and cannot be edited.",
+    errorTitle="Bottom Dimensions Locked",
+    error="Bottom Width and Bottom Length are calculated from Top dimensions and slope. Edit Width/Length instead.",
+)
+
+# (sqref, type, formula1, allow_blank, messages)
+DATA_VALIDATIONS = [
+    # Retention basis dropdown
+    (
+        "B16",
+        "list",
+        '"Max (1/2"" lot | 1"" impervious),1/2"" over lot,1"" over lot,1.5"" over lot,1"" over impervious"',
+        False,
+        None,
+    ),
+    # Input highlight ON/OFF dropdown
+    ("B25", "list", '"ON,OFF"', False, None),
+    # YES/NO dropdown
+    ("J20:J23", "list", '"YES,NO"', False, None),
+    # Guard T-Swale inputs so computed bottom dimensions cannot be below 2.0 ft.
+    # Covers every swale row: the formula skips rows whose type is not T-Swale.
+    (
+        "E20:F23",
+        "custom",
+        'OR(UPPER(INDIRECT("B"&ROW()))<>"T-SWALE",INDIRECT("E"&ROW())="",INDIRECT("F"&ROW())="",AND(INDIRECT("E"&ROW())>=2,INDIRECT("F"&ROW())>=2))',
+        True,
+        TRAP_MIN_BOTTOM_MESSAGES,
+    ),
+    # Prevent manual edits to bottom dimensions (calculated cells).
+    ("C20:D23", "custom", "FALSE", False, BOTTOM_LOCKED_MESSAGES),
+]
+
+
+# -----------------------------
+# Seed sanity check
+# -----------------------------
+def swale_volume(swale_type: str, tw: float, tl: float, slope: float = SIDE_SLOPE) -> float:
+    # Same math the sheet evaluates (G depth, C/D bottoms, H volume), in feet.
+    if swale_type.upper() == "V-SWALE":
+        h = tw / (2 * slope)
+        return h * tw * (2 * tl + max(0.0, tl - tw)) / 6
+    h = max(0.0, min((tw - 2) / (2 * slope), (tl - 2) / (2 * slope)))
+    a1 = max(0.0, tw - 2 * slope * h) * max(0.0, tl - 2 * slope * h)
+    a2 = tw * tl
+    return h / 3 * (a1 + a2 + math.sqrt(a1 * a2))
+
+
+def check_swales(swales: Sequence[Mapping[str, object]]) -> None:
+    # Fail fast on seed swales the sheet would show as negative or #NUM! volumes.
+    for s in swales:
+        tw, tl = s["tw"], s["tl"]
+        # Rows with a blank width/length are left alone; the sheet shows them blank too.
+        if not isinstance(tw, (int, float)) or not isinstance(tl, (int, float)):
+            continue
+        volume = swale_volume(str(s["type"]), tw, tl)
+        if not volume >= 0:
+            raise ValueError(f"{s['name']}: seed dimensions give an invalid volume ({volume})")
+
+
+def _is_number_or_blank(value: object) -> bool:
+    if value is None or value == "":
+        return True
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def resolve_seeds(
+    site: Mapping[str, object] | None,
+    swales: Sequence[Mapping[str, object]] | None,
+) -> tuple[dict[str, object], Sequence[Mapping[str, object]]]:
+    # site overrides seed areas by row label; swales replaces the seed swale rows.
+    # The sheet layout (and every range/formula that points into it) is fixed, so
+    # only known site rows and exactly one entry per swale row are accepted.
+    if site is None:
+        site = {}
+    if not isinstance(site, Mapping):
+        raise ValueError(f"site: expected an object of row label -> Sq. Feet, got {site!r}")
+    unknown = set(site) - set(SITE_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown site rows: {', '.join(sorted(map(str, unknown)))}")
+    for label, value in site.items():
+        if not _is_number_or_blank(value):
+            raise ValueError(f"{label}: Sq. Feet must be a number or blank, got {value!r}")
+    # A blank area is left empty (None), never written as an empty string.
+    site_seeds = {**SITE_DEFAULTS, **{label: None if value == "" else value for label, value in site.items()}}
+    if swales is None:
+        swales = SWALE_DEFAULTS
+    if len(swales) != len(SWALE_DEFAULTS):
+        raise ValueError(f"Expected {len(SWALE_DEFAULTS)} swales, got {len(swales)}")
+    for i, s in enumerate(swales, start=1):
+        if not isinstance(s, Mapping):
+            raise ValueError(f"Swale {i}: expected an object with {', '.join(SWALE_KEYS)}, got {s!r}")
+        label = f"Swale {i} ({s['name']})" if "name" in s else f"Swale {i}"
+        missing = [key for key in SWALE_KEYS if key not in s]
+        if missing:
+            raise ValueError(f"{label}: missing {', '.join(missing)}")
+        if str(s["type"]).upper() not in SWALE_TYPES:
+            raise ValueError(f"{label}: unknown swale type {s['type']!r} (expected T-Swale or V-Swale)")
+        for key in ("tw", "tl"):
+            if not _is_number_or_blank(s[key]):
+                raise ValueError(f"{label}: {key} must be a number or blank, got {s[key]!r}")
+    check_swales(swales)
+    return site_seeds, swales
+
+
+# -----------------------------
+# Table rows: {column: value} per sheet row, shared by make() and make_xlsxwriter()
+# -----------------------------
+SITE_TOTALS = (("Impervious area", 9, "=SUM(B4:B7)"), ("Open space", 10, "=$B$3-$B$9"))
+SWALE_HEADER_ROW = 19
+
+
+def _site_rows(site_seeds: Mapping[str, object]) -> list[tuple[int, dict[int, object]]]:
+    rows = []
+    for r, (label, seed) in enumerate(site_seeds.items(), start=3):  # 3..7
+        row: dict[int, object] = {
+            COL_A: label,
+            COL_B: seed,
+            COL_C: SITE_ACRES_TMPL.format(r=r),
+            # Percent: blank for Lot size row, else fraction of lot
+            COL_D: None if r == 3 else SITE_PERCENT_TMPL.format(r=r),
+        }
+        rows.append((r, row))
+    return rows
+
+
+def _site_total_rows() -> list[tuple[int, dict[int, object]]]:
+    rows = []
+    for label, r, total in SITE_TOTALS:  # 9..10
+        row: dict[int, object] = {
+            COL_A: label,
+            COL_B: total,
+            COL_C: SITE_ACRES_TMPL.format(r=r),
+            COL_D: SITE_PERCENT_TMPL.format(r=r),
         }
+        rows.append((r, row))
+    return rows
+
+
+def _swale_rows(swales: Sequence[Mapping[str, object]]) -> list[tuple[int, dict[int, object]]]:
+    rows = []
+    for r, s in enumerate(swales, start=SWALE_HEADER_ROW + 1):  # 20..23
+        bottom_w: str | None
+        bottom_l: str | None
+        if str(s["type"]).upper() == "T-SWALE":
+            depth = T_SWALE_DEPTH_TMPL.format(r=r)
+            bottom_w = T_SWALE_BOT_W_TMPL.format(r=r)
+            bottom_l = T_SWALE_BOT_L_TMPL.format(r=r)
+        else:
+            depth = V_SWALE_DEPTH_TMPL.format(r=r)
+            bottom_w = bottom_l = None
+
+        row: dict[int, object] = {
+            COL_A: s["name"],
+            COL_B: s["type"],
+            COL_C: bottom_w,
+            COL_D: bottom_l,
+            COL_E: s["tw"],
+            COL_F: s["tl"],
+            COL_G: depth,
+            COL_H: SWALE_VOLUME_TMPL.format(r=r),
+            COL_J: "NO",
+        }
+        rows.append((r, row))
+    return rows
+
+
+def make(
+    out: Union[str, Path] = "swale_calculator.xlsx",
+    *,
+    site: Mapping[str, object] | None = None,
+    swales: Sequence[Mapping[str, object]] | None = None,
+    force_recalc: bool = True,
+) -> Path:
+    # force_recalc=False leaves Excel's calc-on-load flag unset, for callers that
+    # recalculate the workbook themselves after adding to it.
+    site_seeds, swales = resolve_seeds(site, swales)
+
+    Workbook = _xl("workbook").Workbook
+    WriteOnlyCell = _xl("cell").WriteOnlyCell
+    FormulaRule = _xl("formatting.rule").FormulaRule
+    NamedStyle = _xl("styles").NamedStyle
+    CellRange = _xl("worksheet.cell_range").CellRange
+    DataValidation = _xl("worksheet.datavalidation").DataValidation
+    PageMargins = _xl("worksheet.page").PageMargins
+
+    st = _styles()
+
+    # Write-only mode streams each row straight to the sheet XML, so rows
+    # must be appended top to bottom and every cell styled before it is sent.
+    wb = Workbook(write_only=True)
+    # openpyxl writes formulas without cached results, so Excel must recalculate on
+    # open to show any values; that stays the default.
+    wb.calculation.fullCalcOnLoad = force_recalc
+
+    wb._named_styles[0].font = st.normal_font
+
+    # One named style carries the header font/alignment/fill/border for every header cell.
+    wb.add_named_style(
+        NamedStyle(name=HEADER_STYLE_NAME, font=st.header_font, alignment=st.center, fill=st.fill_header, border=st.border)
     )
 
+    ws = wb.create_sheet("Swale Calculator")
+    ws.sheet_view.showGridLines = False
+    ws.page_margins = PageMargins(left=0.25, right=0.25, top=0.25, bottom=0.25, header=0.25, footer=0.25)
+
+    def set_col_width(widths: Iterable[tuple[str, float]]) -> None:
+        cd = ws.column_dimensions
+        for col, width in widths:
+            cd[col].width = width
+
+    def cell(
+        value: object = None,
+        *,
+        font: Font | None = None,
+        alignment: Alignment | None = None,
+        number_format: str | None = None,
+        fill: PatternFill | None = None,
+        border: Border | None = None,
+    ) -> object:
+        # Only non-default attributes are written. A cell with no styling is handed to
+        # ws.append() as a plain value, which openpyxl writes through one scratch cell.
+        if number_format == GENERAL_FORMAT:
+            number_format = None
+        if font is None and alignment is None and number_format is None and fill is None and border is None:
+            return value
+
+        c = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            c.font = font
+        if alignment is not None:
+            c.alignment = alignment
+        if number_format is not None:
+            c.number_format = number_format
+        if fill is not None:
+            c.fill = fill
+        if border is not None:
+            c.border = border
+        return c
+
+    def header(text: str) -> object:
+        c = WriteOnlyCell(ws, value=text)
+        c.style = HEADER_STYLE_NAME
+        return c
+
+    def table_row(
+        values: dict[int, object],
+        columns: list[tuple[int, str, str, str | None]],
+        font: Font | None = None,
+    ) -> list[object]:
+        # One bordered cell per schema column; columns left out of the schema stay empty.
+        row: list[object] = [None] * columns[-1][0]
+        for col, _header, alignment, number_format in columns:
+            row[col - 1] = cell(
+                values.get(col),
+                font=font,
+                alignment=getattr(st, alignment),
+                number_format=number_format,
+                border=st.border,
+            )
+        return row
+
+    def table_header(columns: list[tuple[int, str, str, str | None]]) -> list[object]:
+        row: list[object] = [None] * columns[-1][0]
+        for col, text, _alignment, _number_format in columns:
+            row[col - 1] = header(text)
+        return row
+
+    def add_dv(
+        sqref: str,
+        dv_type: str,
+        formula1: str,
+        *,
+        allow_blank: bool,
+        messages: Mapping[str, str] | None,
+    ) -> None:
+        # Validations with messages show their prompt on select and block invalid entries.
+        if messages is None:
+            dv = DataValidation(type=dv_type, formula1=formula1, allow_blank=allow_blank)
+        else:
+            dv = DataValidation(
+                type=dv_type,
+                formula1=formula1,
+                allow_blank=allow_blank,
+                errorStyle="stop",
+                showInputMessage=True,
+                showErrorMessage=True,
+                **messages,
+            )
+        dv.add(sqref)
+        ws.data_validations.append(dv)
+
     # -----------------------------
-    # SITE STATISTICS
+    # Layout (column widths and row heights must be set before rows are written)
     # -----------------------------
-    ws["A1"] = "SITE STATISTICS"
-    ws["A1"].font = title_font
-    ws["A1"].alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
+    set_col_width(COLUMN_WIDTHS)
     ws.row_dimensions[1].height = 22
-    ws.merge_cells("A1:C1")
-
-    ws["A2"] = "Description"
-    ws["B2"] = "Sq. Feet"
-    ws["C2"] = "Acres"
-    ws["D2"] = "Percent"
-    for addr in ("A2", "B2", "C2", "D2"):
-        ws[addr].font = header_font
-        ws[addr].alignment = center
-        ws[addr].fill = fill_header
-
-    site_rows = [
-        ("Lot size", 3),
-        ("Building (incl. patios)", 4),
-        ("Driveway", 5),
-        ("Equipment pads", 6),
-        ("Other impervious", 7),
-    ]
-
-    for label, r in site_rows:
-        ws[f"A{r}"] = label
-        ws[f"A{r}"].alignment = left
-
-        ws[f"B{r}"].number_format = "#,##0"
-        ws[f"B{r}"].alignment = right
-
-        ws[f"C{r}"] = f'=IF(OR(B{r}="",B{r}=0),"",B{r}/43560)'
-        ws[f"C{r}"].number_format = "0.000"
-        ws[f"C{r}"].alignment = right
-
-        # Percent: blank for Lot size row, else fraction of lot
-        ws[f"D{r}"] = "" if r == 3 else f'=IF(OR(B{r}="",B{r}=0,$B$3="",$B$3=0),"",B{r}/$B$3)'
-        ws[f"D{r}"].number_format = "0.0%"
-        ws[f"D{r}"].alignment = right
-
-    # Seed example values (edit as needed)
-    ws["B3"] = 6741
-    ws["B4"] = 3224
-    ws["B5"] = 640
-    ws["B6"] = 9
-    ws["B7"] = ""
-
-    ws["A9"] = "Impervious area"
-    ws["B9"] = "=SUM(B4:B7)"
-    ws["C9"] = '=IF(OR(B9="",B9=0),"",B9/43560)'
-    ws["D9"] = '=IF(OR(B9="",B9=0,$B$3="",$B$3=0),"",B9/$B$3)'
-    for addr in ("A9", "B9", "C9", "D9"):
-        ws[addr].font = bold_font
-        ws[addr].alignment = right if addr != "A9" else left
-    ws["B9"].number_format = "#,##0"
-    ws["C9"].number_format = "0.000"
-    ws["D9"].number_format = "0.0%"
-
-    ws["A10"] = "Open space"
-    ws["B10"] = "=$B$3-$B$9"
-    ws["C10"] = '=IF(OR(B10="",B10=0),"",B10/43560)'
-    ws["D10"] = '=IF(OR(B10="",B10=0,$B$3="",$B$3=0),"",B10/$B$3)'
-    for addr in ("A10", "B10", "C10", "D10"):
-        ws[addr].font = bold_font
-        ws[addr].alignment = right if addr != "A10" else left
-    ws["B10"].number_format = "#,##0"
-    ws["C10"].number_format = "0.000"
-    ws["D10"].number_format = "0.0%"
-
-    apply_border("A2:D10")
+    ws.row_dimensions[12].height = 22
 
     # -----------------------------
-    # STORMWATER RETENTION
+    # SITE STATISTICS
     # -----------------------------
-    ws["A12"] = "STORMWATER RETENTION"
-    ws["A12"].font = title_font
-    ws["A12"].alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
-    ws.row_dimensions[12].height = 22
-    ws.merge_cells("A12:C12")
+    ws.append([cell("SITE STATISTICS", font=st.title_font, alignment=st.align_title)])  # row 1
+    ws.merged_cells.add("A1:C1")
 
-    ws["A16"] = "Retention basis"
-    ws["A16"].font = bold_font
-    ws["B16"] = 'Max (1/2" lot | 1" impervious)'
-    ws.merge_cells("B16:D16")
+    ws.append(table_header(SITE_COLUMNS))  # row 2
 
-    apply_left_border("E13:E17")
+    for _r, row in _site_rows(site_seeds):  # rows 3..7
+        ws.append(table_row(row, SITE_COLUMNS))
 
-    ws["A17"] = "Side slope ratio (H:V)"
-    ws["A17"].font = bold_font
-    ws["B17"] = 3
-    ws["B17"].alignment = left
+    ws.append([cell(border=st.border) for _ in SITE_COLUMNS])  # row 8
 
-    ws["A25"] = "Input highlight"
-    ws["A25"].font = bold_font
-    ws["B25"] = "ON"
+    for _r, row in _site_total_rows():  # rows 9..10
+        ws.append(table_row(row, SITE_COLUMNS, font=st.bold_font))
 
-    dv_basis = DataValidation(
-        type="list",
-        formula1='"Max (1/2"" lot | 1"" impervious),1/2"" over lot,1"" over lot,1.5"" over lot,1"" over impervious"',
-        allow_blank=False,
-    )
-    ws.add_data_validation(dv_basis)
-    dv_basis.add(ws["B16"])
-
-    dv_highlight = DataValidation(type="list", formula1='"ON,OFF"', allow_blank=False)
-    ws.add_data_validation(dv_highlight)
-    dv_highlight.add(ws["B25"])
-
-    ws["A13"] = "Required (cf)"
-    ws["A13"].font = bold_font
-    ws["B13"] = (
-        '=IF($B$16="1/2"" over lot",(0.5/12)*$B$3,'
-        'IF($B$16="1"" over lot",(1/12)*$B$3,'
-        'IF($B$16="1.5"" over lot",(1.5/12)*$B$3,'
-        'IF($B$16="1"" over impervious",(1/12)*$B$9,'
-        'MAX((0.5/12)*$B$3,(1/12)*$B$9)))))'
-    )
-    ws["B13"].number_format = "#,##0.0"
-    ws["B13"].alignment = left
-
-    ws["A14"] = "Provided (cf)"
-    ws["A14"].font = bold_font
-    # Provided = sum volumes where Select=YES (H20:H23, J20:J23)
-    ws["B14"] = '=SUMPRODUCT(--($J$20:$J$23="YES"),$H$20:$H$23)'
-    ws["B14"].number_format = "#,##0.0"
-    ws["B14"].alignment = left
-
-    ws["A15"] = "FHA Type B"
-    ws["A15"].font = bold_font
-    ws["B15"] = "Drainage to front and rear"
-    ws.merge_cells("B15:D15")
-
-    ws["F13"] = "Retention Options (cf)"
-    ws["F13"].font = bold_font
-    ws["F13"].alignment = Alignment(horizontal="left", vertical="center", wrap_text=True)
-    ws.merge_cells("F13:H13")
-
-    ws["F14"] = '1/2" over lot'
-    ws["F15"] = '1" over lot'
-    ws["F16"] = '1.5" over lot'
-    ws["F17"] = '1" over impervious'
-    for addr in ("F14", "F15", "F16", "F17"):
-        ws[addr].alignment = left
-    ws.merge_cells("F14:G14")
-    ws.merge_cells("F15:G15")
-    ws.merge_cells("F16:G16")
-    ws.merge_cells("F17:G17")
-
-    ws["H14"] = '=TEXT((0.5/12)*$B$3,"#,##0.0")'
-    ws["H15"] = '=TEXT((1/12)*$B$3,"#,##0.0")'
-    ws["H16"] = '=TEXT((1.5/12)*$B$3,"#,##0.0")'
-    ws["H17"] = '=TEXT((1/12)*$B$9,"#,##0.0")'
-    for addr in ("H14", "H15", "H16", "H17"):
-        ws[addr].alignment = right
+    ws.append([])  # row 11
 
     # -----------------------------
-    # SWALES TABLE
+    # STORMWATER RETENTION
     # -----------------------------
-    header_row = 19
-    headers = [
-        ("Swale", "A"),
-        ("Type", "B"),
-        ("Bot W (ft)", "C"),
-        ("Bot L (ft)", "D"),
-        ("Width (ft)", "E"),
-        ("Length (ft)", "F"),
-        ("Depth (in)", "G"),
-        ("Volume (cf)", "H"),
-        ("Select", "J"),
+    ws.append([cell("STORMWATER RETENTION", font=st.title_font, alignment=st.align_title)])  # row 12
+    ws.merged_cells.add("A12:C12")
+
+    # Rows 13..17: A/B/C/D controls, E left border, F:H retention options.
+    retention_rows = [
+        (cell("Required (cf)", font=st.bold_font), cell(REQUIRED_FORMULA, number_format="#,##0.0", alignment=st.left)),
+        (cell("Provided (cf)", font=st.bold_font), cell(PROVIDED_FORMULA, number_format="#,##0.0", alignment=st.left)),
+        (cell("FHA Type B", font=st.bold_font), cell("Drainage to front and rear")),
+        (cell("Retention basis", font=st.bold_font), cell('Max (1/2" lot | 1" impervious)')),
+        (cell("Side slope ratio (H:V)", font=st.bold_font), cell(SIDE_SLOPE, alignment=st.left)),
     ]
-
-    for text, col in headers:
-        cell = f"{col}{header_row}"
-        ws[cell] = text
-        ws[cell].font = header_font
-        ws[cell].alignment = center
-        ws[cell].fill = fill_header
-
-    swale_defaults = [
-        # T-Swale/Frustum: top WxL in E/F, depth in G (in), bottom C/D auto-calculated at 3H:1V (using H1)
-        dict(name="Swale A", type="T-Swale", tw=8, tl=48),
-        dict(name="Swale B", type="T-Swale", tw=8, tl=24),
-        # V-Swale: E=top width, F=length, G=max depth (in) auto-calculated at 3H:1V (using H1)
-        dict(name="Swale C", type="V-Swale", tw=8, tl=48),
-        dict(name="Swale D", type="V-Swale", tw=8, tl=24),
+    options = [
+        (cell("Retention Options (cf)", font=st.bold_font, alignment=st.left), None),
+    ] + [
+        (cell(label, alignment=st.left), cell(f'=TEXT({volume},"#,##0.0")', alignment=st.right))
+        for (label, _inches, _area), volume in zip(RETENTION_OPTIONS, RETENTION_VOLUMES)
     ]
+    for (a, b), (f, h) in zip(retention_rows, options):
+        ws.append([a, b, None, None, cell(border=st.left_border), f, None, h])
 
-    for i, s in enumerate(swale_defaults):
-        r = header_row + 1 + i  # 20..23
-        ws[f"A{r}"] = s["name"]
-        ws[f"A{r}"].alignment = left
+    ws.merged_cells.add("F13:H13")
+    ws.merged_cells.add("B15:D15")
+    ws.merged_cells.add("B16:D16")
+    for r in range(14, 18):
+        ws.merged_cells.add(CellRange(min_col=COL_F, min_row=r, max_col=COL_G, max_row=r))
 
-        ws[f"B{r}"] = s["type"]
-        ws[f"B{r}"].alignment = center
+    ws.append([])  # row 18
 
-        # inputs
-        for col in ("C", "D", "E", "F", "G"):
-            ws[f"{col}{r}"].alignment = right
+    # -----------------------------
+    # SWALES TABLE
+    # -----------------------------
+    ws.append(table_header(SWALE_COLUMNS))  # row 19
 
-        ws[f"E{r}"] = s["tw"]
-        ws[f"F{r}"] = s["tl"]
-        if s["type"] == "T-Swale":
-            ws[f"G{r}"] = f'=IF(OR(E{r}="",F{r}=""),"",12*MAX(0,MIN((E{r}-2)/(2*$B$17),(F{r}-2)/(2*$B$17))))'
-            ws[f"C{r}"] = f'=IF(OR(E{r}="",G{r}=""),"",MAX(0,E{r}-2*$B$17*(G{r}/12)))'
-            ws[f"D{r}"] = f'=IF(OR(F{r}="",G{r}=""),"",MAX(0,F{r}-2*$B$17*(G{r}/12)))'
-        else:
-            ws[f"G{r}"] = f'=IF(E{r}="","",12*(E{r}/(2*$B$17)))'
-        ws[f"C{r}"].number_format = "0.0"
-        ws[f"D{r}"].number_format = "0.0"
-        ws[f"G{r}"].number_format = "0.0"
-
-        # Volume formula:
-        # - V-Swale (with sloped short sides): prismoid along length,
-        #   h*TopWidth*(2*TopLength + BottomLength)/6, where BottomLength=max(0, TopLength-TopWidth)
-        # - T-Swale/Frustum: h/3*(A1+A2+sqrt(A1*A2)), A1=C*D, A2=E*F, h=G/12
-        ws[f"H{r}"] = (
-            f'=IF(UPPER($B{r})="V-SWALE",'
-            f'IF(OR(E{r}="",F{r}="",G{r}=""),"",(G{r}/12)*E{r}*(2*F{r}+MAX(0,F{r}-E{r}))/6),'
-            f'IF(OR(C{r}="",D{r}="",E{r}="",F{r}="",G{r}=""),"",'
-            f'(G{r}/12)/3*((C{r}*D{r})+(E{r}*F{r})+SQRT((C{r}*D{r})*(E{r}*F{r}))))'
-            f')'
-        )
-        ws[f"H{r}"].number_format = "#,##0.0"
-        ws[f"H{r}"].alignment = right
-
-        ws[f"J{r}"] = "NO"
-        ws[f"J{r}"].alignment = center
+    for _r, row in _swale_rows(swales):  # rows 20..23
+        ws.append(table_row(row, SWALE_COLUMNS))
 
-    # YES/NO dropdown
-    dv_use = DataValidation(type="list", formula1='"YES,NO"', allow_blank=False)
-    ws.add_data_validation(dv_use)
-    dv_use.add("J20:J23")
+    ws.append([])  # row 24
 
-    # Guard T-Swale inputs so computed bottom dimensions cannot be below 2.0 ft.
-    dv_trap_min_bottom = DataValidation(
-        type="custom",
-        formula1='OR(UPPER(INDIRECT("B"&ROW()))<>"T-SWALE",INDIRECT("E"&ROW())="",INDIRECT("F"&ROW())="",AND(INDIRECT("E"&ROW())>=2,INDIRECT("F"&ROW())>=2))',
-        allow_blank=True,
-        errorStyle="stop",
-    )
-    dv_trap_min_bottom.showInputMessage = True
-    dv_trap_min_bottom.showErrorMessage = True
-    dv_trap_min_bottom.promptTitle = "T-Swale Minimum Bottom"
-    dv_trap_min_bottom.prompt = "For T-Swales, top width and top length must each be at least 2.0 ft so bottom sides stay >= 2.0 ft."
-    dv_trap_min_bottom.errorTitle = "Invalid T-Swale Top Dimensions"
-    dv_trap_min_bottom.error = "Increase top width/length to at least 2.0 ft to keep T-Swale bottom width/length at or above 2.0 ft."
-    ws.add_data_validation(dv_trap_min_bottom)
-    dv_trap_min_bottom.add("E20:F21")
+    # Input highlight toggle sits below the swales table.
+    ws.append([cell("Input highlight", font=st.bold_font), cell("ON")])  # row 25
 
-    # Prevent manual edits to bottom dimensions (calculated cells).
-    dv_bottom_locked = DataValidation(type="custom", formula1="FALSE", allow_blank=False, errorStyle="stop")
-    dv_bottom_locked.showInputMessage = True
-    dv_bottom_locked.showErrorMessage = True
-    dv_bottom_locked.promptTitle = "Calculated Cell"
-    dv_bottom_locked.prompt = "Bottom Width/Length are calculated automatically and cannot be edited."
-    dv_bottom_locked.errorTitle = "Bottom Dimensions Locked"
-    dv_bottom_locked.error = "Bottom Width and Bottom Length are calculated from Top dimensions and slope. Edit Width/Length instead."
-    ws.add_data_validation(dv_bottom_locked)
-    dv_bottom_locked.add("C20:D23")
+    # -----------------------------
+    # VALIDATION & CONDITIONAL FORMATTING
+    # -----------------------------
+    for sqref, dv_type, formula1, allow_blank, messages in DATA_VALIDATIONS:
+        add_dv(sqref, dv_type, formula1, allow_blank=allow_blank, messages=messages)
 
+    # Input highlight: one rule over every editable input range (space-separated sqref).
     ws.conditional_formatting.add(
-        "B3:B7",
-        FormulaRule(formula=['$B$25="ON"'], fill=fill_input, stopIfTrue=True),
-    )
-    ws.conditional_formatting.add(
-        "E20:E23",
-        FormulaRule(formula=['$B$25="ON"'], fill=fill_input, stopIfTrue=True),
-    )
-    ws.conditional_formatting.add(
-        "G20:G23",
-        FormulaRule(formula=['$B$25="ON"'], fill=fill_input, stopIfTrue=True),
+        "B3:B7 E20:E23 G20:G23",
+        FormulaRule(formula=['$B$25="ON"'], fill=st.fill_input, stopIfTrue=True),
     )
     ws.conditional_formatting.add(
         "A20:H23",
-        FormulaRule(formula=['$J20="NO"'], font=deprecate_font, fill=fill_deprecated),
+        FormulaRule(formula=['$J20="NO"'], font=st.deprecate_font, fill=st.fill_deprecated),
     )
 
-    apply_border("A19:H23")
-    apply_border("J19:J23")
-
     out_path = Path(out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     wb.save(str(out_path))
     return out_path
 
 
+def make_xlsxwriter(
+    out: Union[str, Path] = "swale_calculator.xlsx",
+    *,
+    site: Mapping[str, object] | None = None,
+    swales: Sequence[Mapping[str, object]] | None = None,
+    force_recalc: bool = True,
+) -> Path:
+    # The same sheet as make(), written with XlsxWriter (an optional dependency)
+    # instead of openpyxl. Rows and columns are 0-based here.
+    site_seeds, swales = resolve_seeds(site, swales)
+
+    import xlsxwriter
+
+    out_path = Path(out)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    wb = xlsxwriter.Workbook(str(out_path))
+    wb.calc_on_load = force_recalc
+
+    ws = wb.add_worksheet("Swale Calculator")
+    ws.hide_gridlines(2)
+    ws.set_margins(left=0.25, right=0.25, top=0.25, bottom=0.25)
+    ws.set_header(margin=0.25)
+    ws.set_footer(margin=0.25)
+
+    formats: dict[tuple[tuple[str, ...], str | None], object] = {}
+
+    def fmt(*styles: str, number_format: str | None = None) -> object:
+        # XlsxWriter adds one format per combination of properties, so each
+        # combination of XLSXWRITER_STYLES entries is built once and reused.
+        if not styles and number_format is None:
+            return None
+        key = (styles, number_format)
+        if key not in formats:
+            props: dict[str, object] = {}
+            for name in styles:
+                props.update(XLSXWRITER_STYLES[name])
+            if number_format is not None:
+                props["num_format"] = number_format
+            formats[key] = wb.add_format(props)
+        return formats[key]
+
+    def table_row(
+        r: int,
+        values: dict[int, object],
+        columns: list[tuple[int, str, str, str | None]],
+        *styles: str,
+    ) -> None:
+        for col, _header, alignment, number_format in columns:
+            ws.write(r, col - 1, values.get(col), fmt(*styles, alignment, "border", number_format=number_format))
+
+    def table_header(r: int, columns: list[tuple[int, str, str, str | None]]) -> None:
+        header = fmt("header_font", "center", "fill_header", "border")
+        for col, text, _alignment, _number_format in columns:
+            ws.write(r, col - 1, text, header)
+
+    # set_column() adds Excel's 5px cell padding on top of the width it is given,
+    # while openpyxl writes COLUMN_WIDTHS as-is. Passing the same width in pixels
+    # (7px per character, as both libraries count it) writes the same <col width>.
+    for letter, width in COLUMN_WIDTHS:
+        ws.set_column_pixels(f"{letter}:{letter}", width * 7)
+    ws.set_row(0, 22)
+    ws.set_row(11, 22)
+
+    # -----------------------------
+    # SITE STATISTICS
+    # -----------------------------
+    ws.merge_range("A1:C1", "SITE STATISTICS", fmt("title_font", "align_title"))
+    table_header(1, SITE_COLUMNS)
+
+    for r, row in _site_rows(site_seeds):
+        table_row(r - 1, row, SITE_COLUMNS)
+
+    for col, _header, _alignment, _number_format in SITE_COLUMNS:  # row 8
+        ws.write_blank(7, col - 1, None, fmt("border"))
+
+    for r, row in _site_total_rows():
+        table_row(r - 1, row, SITE_COLUMNS, "bold_font")
+
+    # -----------------------------
+    # STORMWATER RETENTION
+    # -----------------------------
+    ws.merge_range("A12:C12", "STORMWATER RETENTION", fmt("title_font", "align_title"))
+
+    bold = fmt("bold_font")
+    ws.write("A13", "Required (cf)", bold)
+    ws.write("B13", REQUIRED_FORMULA, fmt("left", number_format="#,##0.0"))
+    ws.write("A14", "Provided (cf)", bold)
+    ws.write("B14", PROVIDED_FORMULA, fmt("left", number_format="#,##0.0"))
+    ws.write("A15", "FHA Type B", bold)
+    ws.merge_range("B15:D15", "Drainage to front and rear", None)
+    ws.write("A16", "Retention basis", bold)
+    ws.merge_range("B16:D16", 'Max (1/2" lot | 1" impervious)', None)
+    ws.write("A17", "Side slope ratio (H:V)", bold)
+    ws.write("B17", SIDE_SLOPE, fmt("left"))
+
+    for r in range(12, 17):  # E13:E17
+        ws.write_blank(r, COL_E - 1, None, fmt("left_border"))
+
+    ws.merge_range("F13:H13", "Retention Options (cf)", fmt("bold_font", "left"))
+    for r, ((label, _inches, _area), volume) in enumerate(zip(RETENTION_OPTIONS, RETENTION_VOLUMES), start=14):
+        ws.merge_range(r - 1, COL_F - 1, r - 1, COL_G - 1, label, fmt("left"))
+        ws.write(r - 1, COL_H - 1, f'=TEXT({volume},"#,##0.0")', fmt("right"))
+
+    # -----------------------------
+    # SWALES TABLE
+    # -----------------------------
+    table_header(SWALE_HEADER_ROW - 1, SWALE_COLUMNS)
+
+    for r, row in _swale_rows(swales):
+        table_row(r - 1, row, SWALE_COLUMNS)
+
+    ws.write("A25", "Input highlight", bold)
+    ws.write("B25", "ON")
+
+    # -----------------------------
+    # VALIDATION & CONDITIONAL FORMATTING
+    # -----------------------------
+    for sqref, dv_type, formula1, allow_blank, messages in DATA_VALIDATIONS:
+        options: dict[str, object] = dict(validate=dv_type, value=formula1, ignore_blank=allow_blank)
+        if messages is None:
+            options.update(show_input=False, show_error=False)
+        else:
+            options.update(
+                error_type="stop",
+                input_title=messages["promptTitle"],
+                input_message=messages["prompt"],
+                error_title=messages["errorTitle"],
+                error_message=messages["error"],
+            )
+        ws.data_validation(sqref, options)
+
+    ws.conditional_format(
+        "B3:B7",
+        dict(
+            type="formula",
+            criteria='$B$25="ON"',
+            format=fmt("fill_input"),
+            stop_if_true=True,
+            multi_range="B3:B7 E20:E23 G20:G23",
+        ),
+    )
+    ws.conditional_format(
+        "A20:H23",
+        dict(type="formula", criteria='$J20="NO"', format=fmt("deprecate_font", "fill_deprecated")),
+    )
+
+    wb.close()
+    return out_path
+
+
+ENGINES = {"openpyxl": make, "xlsxwriter": make_xlsxwriter}
+
+
+class BuildOptions(TypedDict, total=False):
+    # Keyword options make_many() passes through to every engine call.
+    force_recalc: bool
+
+
+class BatchSeeds(TypedDict, total=False):
+    site: Mapping[str, object]
+    swales: Sequence[Mapping[str, object]]
+
+
+class BatchEntry(BatchSeeds):
+    out: Union[str, Path]
+
+
+BatchItem = Union[str, Path, BatchEntry]
+BATCH_KEYS = {"out", "site", "swales"}
+
+
+def _split_entry(item: BatchItem) -> tuple[Union[str, Path], BatchSeeds]:
+    # One batch entry: an output path, or {"out": ..., "site": ..., "swales": ...}
+    # whose seed overrides are passed through to the engine.
+    seeds = BatchSeeds()
+    if not isinstance(item, Mapping):
+        out: object = item
+    else:
+        out = item.get("out")
+        if "site" in item:
+            seeds["site"] = item["site"]
+        if "swales" in item:
+            seeds["swales"] = item["swales"]
+    if not isinstance(out, (str, Path)) or not str(out):
+        raise ValueError(f"Batch entry needs an output path, got {out!r}")
+    return out, seeds
+
+
+def _build(engine: str, options: BuildOptions, item: BatchItem) -> Path:
+    out, seeds = _split_entry(item)
+    return ENGINES[engine](out, **seeds, **options)
+
+
+def make_many(
+    items: Iterable[BatchItem],
+    *,
+    engine: str = "openpyxl",
+    jobs: int | None = None,
+    force_recalc: bool = True,
+) -> list[Path]:
+    # Each workbook is independent, so the batch is split across jobs worker
+    # processes (default: one per CPU). Entries go out in contiguous chunks, one per
+    # worker, so a JIT (PyPy) still warms up across the workbooks a worker builds.
+    items = list(items)
+    # Check every entry's seeds up front, so a bad entry fails the batch before any
+    # workbook is written (make() checks them again in the worker).
+    for item in items:
+        out, seeds = _split_entry(item)
+        try:
+            resolve_seeds(seeds.get("site"), seeds.get("swales"))
+        except ValueError as exc:
+            raise ValueError(f"{out}: {exc}") from None
+    jobs = min(jobs or os.cpu_count() or 1, len(items))
+    options: BuildOptions = {"force_recalc": force_recalc}
+    build = partial(_build, engine, options)
+    if jobs <= 1:
+        return [build(item) for item in items]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(build, items, chunksize=-(-len(items) // jobs)))
+
+
+def load_batch(path: Union[str, Path]) -> list[BatchItem]:
+    # A JSON list of output paths and/or {"out", "site", "swales"} objects.
+    items = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(items, list):
+        raise ValueError(f"{path}: expected a JSON list of batch entries")
+    for item in items:
+        if isinstance(item, dict):
+            if not isinstance(item.get("out"), str):
+                raise ValueError(f"{path}: batch entry without an 'out' path string: {item}")
+            unknown = set(item) - BATCH_KEYS
+            if unknown:
+                raise ValueError(f"{path}: unknown batch entry keys: {', '.join(sorted(unknown))}")
+        elif not isinstance(item, str):
+            raise ValueError(f"{path}: batch entries must be paths or objects, got {item!r}")
+    return items
+
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Generate Swale Calculator workbook.")
-    p.add_argument("--out", default="swale_calculator.xlsx", help="Output .xlsx path.")
+    outputs = p.add_mutually_exclusive_group()
+    outputs.add_argument(
+        "--out",
+        nargs="+",
+        default=["swale_calculator.xlsx"],
+        help="Output .xlsx path (pass several to generate a batch in one run).",
+    )
+    outputs.add_argument(
+        "--batch",
+        metavar="CONFIG.json",
+        help="JSON list of output paths or {\"out\", \"site\", \"swales\"} objects to generate.",
+    )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for a batch (default: one per CPU).",
+    )
+    p.add_argument(
+        "--force-recalc",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Have Excel recalculate every formula when the workbook is opened (default: on).",
+    )
+    p.add_argument(
+        "--engine",
+        choices=sorted(ENGINES),
+        default="openpyxl",
+        help="Library used to write the workbook (xlsxwriter must be installed separately).",
+    )
     return p.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
-    out_path = make(args.out)
-    print(f"Wrote: {out_path}")
\ No newline at end of file
+    items = load_batch(args.batch) if args.batch else args.out
+    for out_path in make_many(items, engine=args.engine, jobs=args.jobs, force_recalc=args.force_recalc):
+        print(f"Wrote: {out_path}")
\ No newline at end of file